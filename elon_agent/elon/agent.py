@@ -3,10 +3,16 @@
 from __future__ import annotations
 
 import asyncio
+import atexit
 import datetime as dt
+import functools
+import hashlib
+import itertools
 import logging
 import os
-import uuid
+import secrets
+import time
+from pathlib import Path
 from typing import Any, Iterable
 
 import httpx
@@ -18,6 +24,7 @@ from google.adk.tools.tool_context import ToolContext
 from a2a.client import A2ACardResolver, A2AClient
 from a2a.types import (
     AgentCard,
+    JSONRPCErrorResponse,
     MessageSendParams,
     SendMessageRequest,
     SendMessageResponse,
@@ -26,28 +33,169 @@ from a2a.types import (
 from .tools import book_badminton_court, list_court_availabilities
 
 load_dotenv()
-nest_asyncio.apply()
 
 LOGGER = logging.getLogger(__name__)
 
 DEFAULT_REMOTE_AGENT_URLS = ("http://localhost:10004", "http://localhost:10005")
 REMOTE_AGENT_URLS_ENV_VAR = "A2A_REMOTE_AGENT_URLS"
 REMOTE_AGENT_TIMEOUT_SECONDS = 10
+REMOTE_AGENT_MAX_CONNECTIONS = 100
+REMOTE_AGENT_MAX_KEEPALIVE_CONNECTIONS = 20
+CIRCUIT_BREAKER_FAILURE_THRESHOLD = 3
+CIRCUIT_BREAKER_COOLDOWN_SECONDS = 30
+CARD_TTL_SECONDS = 60
+CARD_CACHE_DIR = Path.home() / ".cache" / "elon_agent" / "cards"
+DISABLE_CARD_CACHE_ENV_VAR = "A2A_DISABLE_CARD_CACHE"
 
+# Message IDs only need to be unique within this process, so a random per-process
+# prefix plus a counter is enough and avoids generating a UUID per message.
+_MESSAGE_ID_PREFIX = secrets.token_hex(8)
+_MESSAGE_COUNTER = itertools.count()
 
-class RemoteAgentConnection:
-    """Wraps a persistent A2A client connection to one participant agent."""
 
-    def __init__(self, agent_card: AgentCard, agent_url: str) -> None:
+def _next_message_id() -> str:
+    return f"{_MESSAGE_ID_PREFIX}-{next(_MESSAGE_COUNTER):016x}"
+
+
+_SHARED_HTTP_CLIENT: httpx.AsyncClient | None = None
+
+
+def _get_shared_http_client() -> httpx.AsyncClient:
+    """Return the pooled HTTP client shared by every remote agent connection."""
+    global _SHARED_HTTP_CLIENT
+    if _SHARED_HTTP_CLIENT is None or _SHARED_HTTP_CLIENT.is_closed:
+        _SHARED_HTTP_CLIENT = httpx.AsyncClient(
+            timeout=REMOTE_AGENT_TIMEOUT_SECONDS,
+            limits=httpx.Limits(
+                max_connections=REMOTE_AGENT_MAX_CONNECTIONS,
+                max_keepalive_connections=REMOTE_AGENT_MAX_KEEPALIVE_CONNECTIONS,
+            ),
+        )
+    return _SHARED_HTTP_CLIENT
+
+
+async def close_shared_http_client() -> None:
+    """Close the shared HTTP client and release its pooled connections."""
+    global _SHARED_HTTP_CLIENT
+    if _SHARED_HTTP_CLIENT is not None and not _SHARED_HTTP_CLIENT.is_closed:
+        await _SHARED_HTTP_CLIENT.aclose()
+    _SHARED_HTTP_CLIENT = None
+
+
+def _close_shared_http_client_at_exit() -> None:
+    if _SHARED_HTTP_CLIENT is None or _SHARED_HTTP_CLIENT.is_closed:
+        return
+    try:
+        asyncio.run(close_shared_http_client())
+    except Exception as exc:  # noqa: BLE001 - best-effort interpreter shutdown
+        LOGGER.debug("Failed to close shared HTTP client at exit: %s", exc)
+
+
+atexit.register(_close_shared_http_client_at_exit)
+
+
+_CARD_CACHE: dict[str, tuple[float, AgentCard]] = {}
+
+
+def _card_cache_path(url: str) -> Path:
+    return CARD_CACHE_DIR / f"{hashlib.sha1(url.encode('utf-8')).hexdigest()}.json"
+
+
+def _read_cached_card(url: str) -> AgentCard | None:
+    now = time.time()
+    cached = _CARD_CACHE.get(url)
+    if cached is not None and now - cached[0] < CARD_TTL_SECONDS:
+        return cached[1]
+
+    path = _card_cache_path(url)
+    try:
+        fetched_at = path.stat().st_mtime
+        if now - fetched_at >= CARD_TTL_SECONDS:
+            return None
+        card = AgentCard.model_validate_json(path.read_bytes())
+    except (OSError, ValueError):
+        return None
+
+    _CARD_CACHE[url] = (fetched_at, card)
+    return card
+
+
+def _write_cached_card(url: str, card: AgentCard) -> None:
+    _CARD_CACHE[url] = (time.time(), card)
+    path = _card_cache_path(url)
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(card.model_dump_json(), encoding="utf-8")
+    except OSError as exc:
+        LOGGER.debug("Failed to write cached agent card for %s: %s", url, exc)
+
+
+async def _cached_get_agent_card(client: httpx.AsyncClient, url: str) -> AgentCard:
+    """Fetch an agent card, reusing a recent in-memory or on-disk copy when possible."""
+    use_cache = os.getenv(DISABLE_CARD_CACHE_ENV_VAR, "") != "1"
+    if use_cache:
+        cached_card = _read_cached_card(url)
+        if cached_card is not None:
+            return cached_card
+
+    card = await A2ACardResolver(client, url).get_agent_card()
+    if use_cache:
+        _write_cached_card(url, card)
+    return card
+
+
+class RemoteAgentUnavailableError(RuntimeError):
+    """Raised instead of calling a participant whose circuit breaker is open."""
+
+
+class RemoteAgentConnection:
+    """Wraps an A2A client for one participant agent on a shared HTTP client."""
+
+    def __init__(
+        self,
+        agent_card: AgentCard,
+        agent_url: str,
+        http_client: httpx.AsyncClient | None = None,
+    ) -> None:
         self.agent_card = agent_card
         self.agent_url = agent_url.rstrip("/")
-        self.http_client = httpx.AsyncClient(timeout=REMOTE_AGENT_TIMEOUT_SECONDS)
+        self.http_client = http_client or _get_shared_http_client()
         self.client = A2AClient(self.http_client, agent_card, url=self.agent_url)
+        self.consecutive_failures = 0
+        self.opened_until: float | None = None
 
     async def send_message(
         self, message_request: SendMessageRequest
     ) -> SendMessageResponse:
-        return await self.client.send_message(message_request)
+        """Send a message, failing fast while the agent's circuit breaker is open."""
+        if self.opened_until is not None:
+            remaining = self.opened_until - time.monotonic()
+            if remaining > 0:
+                raise RemoteAgentUnavailableError(
+                    f"Agent '{self.agent_card.name}' is temporarily unavailable after "
+                    f"repeated failures; retry in {remaining:.0f}s."
+                )
+
+        try:
+            response = await asyncio.wait_for(
+                self.client.send_message(message_request),
+                timeout=REMOTE_AGENT_TIMEOUT_SECONDS,
+            )
+        except Exception:
+            self.consecutive_failures += 1
+            if self.consecutive_failures >= CIRCUIT_BREAKER_FAILURE_THRESHOLD:
+                # A failure after the cooldown re-opens the circuit immediately.
+                self.opened_until = time.monotonic() + CIRCUIT_BREAKER_COOLDOWN_SECONDS
+                LOGGER.warning(
+                    "Opening circuit for %s after %d consecutive failures.",
+                    self.agent_url,
+                    self.consecutive_failures,
+                )
+            raise
+
+        self.consecutive_failures = 0
+        self.opened_until = None
+        return response
 
 
 class ElonAgent:
@@ -57,10 +205,17 @@ class ElonAgent:
         self.remote_agent_urls = [url.rstrip("/") for url in (remote_agent_urls or []) if url]
         self.remote_connections: dict[str, RemoteAgentConnection] = {}
         self.cards: dict[str, AgentCard] = {}
+        self._casefolded_connections: dict[str, RemoteAgentConnection] = {}
         self.agent: Agent | None = None
+        self._instruction = ""
+        self._sorted_remote_names: tuple[str, ...] = ()
 
     async def create_agent(self) -> Agent:
         await self._load_remote_agents()
+        # Remote connections are fixed once loading completes, so derived values are
+        # computed once here instead of on every use.
+        self._sorted_remote_names = tuple(sorted(self.remote_connections))
+        self._instruction = self._build_instruction()
 
         self.agent = Agent(
             model="gemini-2.0-flash",
@@ -69,9 +224,10 @@ class ElonAgent:
                 "Coordinates badminton scheduling by querying participant agents "
                 "and booking a court."
             ),
-            instruction=self._build_instruction(),
+            instruction=self._instruction,
             tools=[
                 self.send_message,
+                self.send_message_many,
                 book_badminton_court,
                 list_court_availabilities,
             ],
@@ -79,8 +235,7 @@ class ElonAgent:
         return self.agent
 
     def _build_instruction(self) -> str:
-        friend_names = sorted(self.cards.keys())
-        friends_section = "\n".join(f"- {name}" for name in friend_names)
+        friends_section = "\n".join(f"- {name}" for name in self._sorted_remote_names)
         if not friends_section:
             friends_section = "- No participant agents are currently connected. Ask the user to start them."
 
@@ -88,6 +243,8 @@ class ElonAgent:
             "You are the host coordinator for badminton scheduling.\n"
             "Your responsibilities are:\n"
             "1. Ask participant agents for availability (starting from tomorrow).\n"
+            "   When asking more than one agent the same question, use send_message_many "
+            "so they are queried concurrently.\n"
             "2. Find a common timeslot.\n"
             "3. Check court availability with local tools.\n"
             "4. Book the court after confirmation.\n\n"
@@ -101,17 +258,30 @@ class ElonAgent:
             LOGGER.warning("No remote agent URLs configured for the host agent.")
             return
 
+        # Card discovery runs in the short-lived setup event loop, so it uses its own
+        # client rather than pooling connections the runtime loop cannot reuse.
         async with httpx.AsyncClient(timeout=REMOTE_AGENT_TIMEOUT_SECONDS) as client:
-            for url in self.remote_agent_urls:
-                resolver = A2ACardResolver(client, url)
-                try:
-                    card = await resolver.get_agent_card()
-                except Exception as exc:  # noqa: BLE001 - best-effort startup
-                    LOGGER.warning("Failed to load agent card from %s: %s", url, exc)
-                    continue
-
-                self.remote_connections[card.name] = RemoteAgentConnection(card, url)
-                self.cards[card.name] = card
+            # Resolve all cards concurrently so startup waits on the slowest
+            # participant rather than the sum of every round-trip.
+            tasks = [
+                asyncio.create_task(_cached_get_agent_card(client, url))
+                for url in self.remote_agent_urls
+            ]
+            results = await asyncio.gather(*tasks, return_exceptions=True)
+
+        for url, result in zip(self.remote_agent_urls, results):
+            if isinstance(result, BaseException):
+                # Best-effort startup: a missing participant should not block the host.
+                LOGGER.warning("Failed to load agent card from %s: %s", url, result)
+                continue
+
+            self.remote_connections[result.name] = RemoteAgentConnection(result, url)
+            self.cards[result.name] = result
+
+        self._casefolded_connections = {
+            name.casefold(): connection
+            for name, connection in self.remote_connections.items()
+        }
 
         if not self.cards:
             LOGGER.warning(
@@ -120,28 +290,19 @@ class ElonAgent:
             )
 
     def _get_remote_connection(self, agent_name: str) -> RemoteAgentConnection | None:
-        exact_match = self.remote_connections.get(agent_name)
-        if exact_match:
-            return exact_match
-
-        normalized = agent_name.casefold()
-        for name, connection in self.remote_connections.items():
-            if name.casefold() == normalized:
-                return connection
-        return None
+        return self.remote_connections.get(agent_name) or self._casefolded_connections.get(
+            agent_name.casefold()
+        )
 
-    async def send_message(
-        self, agent_name: str, task: str, _tool_context: ToolContext
-    ) -> dict[str, Any]:
-        """Send a message to a participant agent via the A2A protocol."""
-        connection = self._get_remote_connection(agent_name)
-        if connection is None:
-            available_agents = sorted(self.remote_connections.keys())
-            raise ValueError(
-                f"Unknown agent '{agent_name}'. Available agents: {available_agents or 'none'}"
-            )
+    def _unknown_agent_message(self, agent_name: str) -> str:
+        return (
+            f"Unknown agent '{agent_name}'. "
+            f"Available agents: {list(self._sorted_remote_names) or 'none'}"
+        )
 
-        message_id = str(uuid.uuid4())
+    @staticmethod
+    def _build_send_request(task: str) -> SendMessageRequest:
+        message_id = _next_message_id()
         payload = {
             "message": {
                 "role": "user",
@@ -150,30 +311,97 @@ class ElonAgent:
             }
         }
 
-        request = SendMessageRequest(
+        return SendMessageRequest(
             id=message_id,
             params=MessageSendParams.model_validate(payload),
         )
-        response = await connection.send_message(request)
 
+    @staticmethod
+    def _format_response(
+        connection: RemoteAgentConnection, response: SendMessageResponse
+    ) -> dict[str, Any]:
         response_payload = (
             response.model_dump(mode="json")
             if hasattr(response, "model_dump")
             else str(response)
         )
-        return {
+        result = {
             "status": "success",
             "agent_name": connection.agent_card.name,
             "agent_url": connection.agent_url,
             "response": response_payload,
         }
+        error_response = getattr(response, "root", None)
+        if isinstance(error_response, JSONRPCErrorResponse):
+            result["status"] = "error"
+            result["message"] = error_response.error.message
+        return result
+
+    @staticmethod
+    def _format_failure(
+        connection: RemoteAgentConnection, error: BaseException
+    ) -> dict[str, Any]:
+        return {
+            "status": "error",
+            "agent_name": connection.agent_card.name,
+            "agent_url": connection.agent_url,
+            "message": f"Failed to message agent: {str(error) or type(error).__name__}",
+        }
 
+    async def send_message(
+        self, agent_name: str, task: str, _tool_context: ToolContext
+    ) -> dict[str, Any]:
+        """Send a message to a participant agent via the A2A protocol."""
+        connection = self._get_remote_connection(agent_name)
+        if connection is None:
+            raise ValueError(self._unknown_agent_message(agent_name))
 
-def _configured_remote_agent_urls() -> list[str]:
+        try:
+            response = await connection.send_message(self._build_send_request(task))
+        except Exception as exc:  # noqa: BLE001 - report failures to the model as data
+            return self._format_failure(connection, exc)
+        return self._format_response(connection, response)
+
+    async def send_message_many(
+        self, agent_names: list[str], task: str, _tool_context: ToolContext
+    ) -> dict[str, Any]:
+        """Send the same message to several participant agents concurrently via A2A."""
+        results: dict[str, Any] = {}
+        # Keyed by the resolved agent name so spellings that differ only in case
+        # still send a single request per participant.
+        pending: dict[str, RemoteAgentConnection] = {}
+        for agent_name in agent_names:
+            connection = self._get_remote_connection(agent_name)
+            if connection is None:
+                results[agent_name] = {
+                    "status": "error",
+                    "message": self._unknown_agent_message(agent_name),
+                }
+            else:
+                pending.setdefault(connection.agent_card.name, connection)
+
+        responses = await asyncio.gather(
+            *(
+                connection.send_message(self._build_send_request(task))
+                for connection in pending.values()
+            ),
+            return_exceptions=True,
+        )
+        for (agent_name, connection), response in zip(pending.items(), responses):
+            if isinstance(response, BaseException):
+                # One failing participant should not hide the other agents' answers.
+                results[agent_name] = self._format_failure(connection, response)
+            else:
+                results[agent_name] = self._format_response(connection, response)
+        return results
+
+
+@functools.lru_cache(maxsize=1)
+def _configured_remote_agent_urls() -> tuple[str, ...]:
     raw_value = os.getenv(REMOTE_AGENT_URLS_ENV_VAR, "")
     if not raw_value.strip():
-        return list(DEFAULT_REMOTE_AGENT_URLS)
-    return [url.strip() for url in raw_value.split(",") if url.strip()]
+        return DEFAULT_REMOTE_AGENT_URLS
+    return tuple(url for url in map(str.strip, raw_value.split(",")) if url)
 
 
 async def setup() -> Agent:
@@ -181,4 +409,22 @@ async def setup() -> Agent:
     return await host.create_agent()
 
 
-root_agent = asyncio.run(setup())
+_root_agent: Agent | None = None
+
+
+def get_root_agent() -> Agent:
+    """Build the host agent on first use and return the cached instance."""
+    global _root_agent
+    if _root_agent is None:
+        # ADK may load the agent while its own event loop is running.
+        nest_asyncio.apply()
+        _root_agent = asyncio.run(setup())
+    return _root_agent
+
+
+def __getattr__(name: str) -> Any:
+    # ADK discovers the agent through the module-level ``root_agent`` attribute;
+    # resolve it lazily so importing this module does not contact remote agents.
+    if name == "root_agent":
+        return get_root_agent()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -2,10 +2,11 @@
 
 from __future__ import annotations
 
-from datetime import date, datetime, timedelta
+from datetime import date, timedelta
 
 AVAILABLE = "available"
 MAINTENANCE = "maintenance"
+_NON_BOOKED_STATES = frozenset({AVAILABLE, MAINTENANCE})
 DEFAULT_SLOT_TIMES = ("08:00", "09:00", "10:00", "11:00")
 
 CourtSchedule = dict[str, dict[str, str]]
@@ -37,16 +38,30 @@ def _build_initial_schedule(base_date: date | None = None) -> CourtSchedule:
 
 
 COURT_SCHEDULE: CourtSchedule = _build_initial_schedule()
+_SORTED_DATES: tuple[str, ...] = tuple(sorted(COURT_SCHEDULE))
 
 
 def reset_court_schedule() -> None:
     """Reset the in-memory schedule to its demo default state."""
-    global COURT_SCHEDULE
+    global COURT_SCHEDULE, _SORTED_DATES
     COURT_SCHEDULE = _build_initial_schedule()
+    _SORTED_DATES = tuple(sorted(COURT_SCHEDULE))
 
 
-def _parse_time_label(value: str) -> datetime:
-    return datetime.strptime(value, "%H:%M")
+def _is_number_label(value: str) -> bool:
+    return 1 <= len(value) <= 2 and value.isascii() and value.isdigit()
+
+
+def _parse_time_label(value: str) -> int:
+    """Parse an HH:MM label into minutes since midnight."""
+    hours, separator, minutes = value.partition(":")
+    if not (separator and _is_number_label(hours) and _is_number_label(minutes)):
+        raise ValueError(f"Invalid time label: {value!r}")
+
+    hour, minute = int(hours), int(minutes)
+    if hour > 23 or minute > 59:
+        raise ValueError(f"Invalid time label: {value!r}")
+    return hour * 60 + minute
 
 
 def list_court_availabilities(requested_date: str) -> dict[str, object]:
@@ -56,7 +71,7 @@ def list_court_availabilities(requested_date: str) -> dict[str, object]:
             "status": "error",
             "message": (
                 f"No court schedule found for {requested_date}. "
-                f"Available demo dates: {sorted(COURT_SCHEDULE.keys())}"
+                f"Available demo dates: {list(_SORTED_DATES)}"
             ),
             "available_slots": [],
             "blocked_slots": {},
@@ -64,13 +79,16 @@ def list_court_availabilities(requested_date: str) -> dict[str, object]:
         }
 
     daily_schedule = COURT_SCHEDULE[requested_date]
-    available_slots = [slot for slot, state in daily_schedule.items() if state == AVAILABLE]
-    blocked_slots = {slot: state for slot, state in daily_schedule.items() if state == MAINTENANCE}
-    booked_slots = {
-        slot: state
-        for slot, state in daily_schedule.items()
-        if state not in {AVAILABLE, MAINTENANCE}
-    }
+    available_slots: list[str] = []
+    blocked_slots: dict[str, str] = {}
+    booked_slots: dict[str, str] = {}
+    for slot, state in daily_schedule.items():
+        if state not in _NON_BOOKED_STATES:
+            booked_slots[slot] = state
+        elif state == AVAILABLE:
+            available_slots.append(slot)
+        else:
+            blocked_slots[slot] = state
 
     return {
         "status": "success",
@@ -93,7 +111,7 @@ def book_badminton_court(
             "status": "error",
             "message": (
                 f"No court schedule found for {requested_date}. "
-                f"Available demo dates: {sorted(COURT_SCHEDULE.keys())}"
+                f"Available demo dates: {list(_SORTED_DATES)}"
             ),
         }
 
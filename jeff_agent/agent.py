@@ -3,20 +3,69 @@
 from __future__ import annotations
 
 import asyncio
+import contextvars
+import functools
+import logging
 import os
-from typing import Any
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import TYPE_CHECKING, Any, TypeVar
 
 from dotenv import load_dotenv
-from langchain.agents import create_agent
-from langchain_core.messages.ai import AIMessage
-from langchain_google_genai import ChatGoogleGenerativeAI
-from langgraph.checkpoint.memory import MemorySaver
+from langchain_core.messages import AIMessage, HumanMessage
 
 from tools import get_availability
 
+if TYPE_CHECKING:
+    from langgraph.checkpoint.memory import MemorySaver
+
 load_dotenv()
 
-_MEMORY = MemorySaver()
+LOGGER = logging.getLogger(__name__)
+
+_Number = TypeVar("_Number", int, float)
+
+RESPONSE_CACHE_MAXSIZE = 256
+RESPONSE_CACHE_TTL_ENV_VAR = "AGENT_RESPONSE_CACHE_TTL"
+DEFAULT_RESPONSE_CACHE_TTL_SECONDS = 60.0
+
+LLM_POOL_SIZE_ENV_VAR = "LLM_POOL_SIZE"
+DEFAULT_LLM_POOL_SIZE = 16
+
+
+def _env_number(name: str, default: _Number, minimum: _Number) -> _Number:
+    """Read a numeric setting from the environment, falling back on invalid values."""
+    raw_value = os.getenv(name, "")
+    if not raw_value:
+        return default
+    try:
+        value = type(default)(raw_value)
+    except ValueError:
+        value = None
+    if value is None or value < minimum:
+        LOGGER.warning("Ignoring invalid %s=%r; using %s.", name, raw_value, default)
+        return default
+    return value
+
+
+# LangGraph calls block, so they run on a pool of their own instead of the loop's
+# default executor, where a slow model call would hold up unrelated work.
+_LLM_POOL = ThreadPoolExecutor(
+    max_workers=_env_number(LLM_POOL_SIZE_ENV_VAR, DEFAULT_LLM_POOL_SIZE, minimum=1),
+    thread_name_prefix="llm",
+)
+
+_MEMORY: MemorySaver | None = None
+
+
+def _get_memory() -> MemorySaver:
+    """Return the checkpointer shared by every Jeff agent instance."""
+    global _MEMORY
+    if _MEMORY is None:
+        from langgraph.checkpoint.memory import MemorySaver
+
+        _MEMORY = MemorySaver()
+    return _MEMORY
 
 
 class JeffAgent:
@@ -28,6 +77,11 @@ class JeffAgent:
         if not os.getenv("GOOGLE_API_KEY"):
             raise ValueError("GOOGLE_API_KEY not found in environment")
 
+        # LangChain and Gemini clients are imported here so importing this module stays
+        # cheap for tooling that never builds the agent.
+        from langchain.agents import create_agent
+        from langchain_google_genai import ChatGoogleGenerativeAI
+
         self.model = ChatGoogleGenerativeAI(model="gemini-2.0-flash")
         self.system_prompt = (
             "You are Jeff Bezos's scheduling assistant.\n"
@@ -40,18 +94,70 @@ class JeffAgent:
             self.model,
             tools=[get_availability],
             system_prompt=self.system_prompt,
-            checkpointer=_MEMORY,
+            checkpointer=_get_memory(),
         )
+        self.response_cache_ttl = _env_number(
+            RESPONSE_CACHE_TTL_ENV_VAR, DEFAULT_RESPONSE_CACHE_TTL_SECONDS, minimum=0.0
+        )
+        # Normalized first-turn query -> (expiry time, answer), oldest entry first.
+        self._first_turn_answers: dict[str, tuple[float, str]] = {}
 
     async def get_response(self, query: str, context_id: str | int) -> str:
         """Return the latest AI response content as plain text."""
-        inputs = {"messages": [("user", query)]}
         config = {"configurable": {"thread_id": str(context_id)}}
 
+        # Later turns depend on the conversation history in the checkpointer, so only
+        # the first turn of a context can reuse an earlier answer to the same query.
+        cache_key = query.strip().lower()
+        is_cacheable = self.response_cache_ttl > 0 and not self.graph.get_state(
+            config
+        ).values.get("messages")
+        if is_cacheable:
+            cached_response = self._get_first_turn_answer(cache_key)
+            if cached_response is not None:
+                # Record the turn so follow-ups in this context see the same history
+                # the client did.
+                self.graph.update_state(
+                    config,
+                    {"messages": [HumanMessage(query), AIMessage(cached_response)]},
+                    as_node="model",
+                )
+                return cached_response
+
+        inputs = {"messages": [("user", query)]}
+
         # LangGraph invoke is synchronous in this usage; run it in a worker thread so
-        # the A2A server event loop remains responsive.
-        raw_response = await asyncio.to_thread(self.graph.invoke, inputs, config)
-        return self._extract_latest_ai_text(raw_response)
+        # the A2A server event loop remains responsive. Unlike asyncio.to_thread,
+        # run_in_executor does not carry contextvars over, and LangChain callbacks and
+        # tracing depend on them.
+        raw_response = await asyncio.get_running_loop().run_in_executor(
+            _LLM_POOL,
+            functools.partial(
+                contextvars.copy_context().run, self.graph.invoke, inputs, config
+            ),
+        )
+        response_text = self._extract_latest_ai_text(raw_response)
+        if is_cacheable:
+            self._store_first_turn_answer(cache_key, response_text)
+        return response_text
+
+    def _get_first_turn_answer(self, cache_key: str) -> str | None:
+        entry = self._first_turn_answers.get(cache_key)
+        if entry is None:
+            return None
+        if time.monotonic() >= entry[0]:
+            del self._first_turn_answers[cache_key]
+            return None
+        return entry[1]
+
+    def _store_first_turn_answer(self, cache_key: str, answer: str) -> None:
+        self._first_turn_answers.pop(cache_key, None)
+        self._first_turn_answers[cache_key] = (
+            time.monotonic() + self.response_cache_ttl,
+            answer,
+        )
+        if len(self._first_turn_answers) > RESPONSE_CACHE_MAXSIZE:
+            del self._first_turn_answers[next(iter(self._first_turn_answers))]
 
     @staticmethod
     def _extract_latest_ai_text(raw_response: dict[str, Any]) -> str:
@@ -69,12 +175,10 @@ class JeffAgent:
             return content.strip()
 
         if isinstance(content, list):
-            text_parts: list[str] = []
-            for part in content:
-                if isinstance(part, dict):
-                    text_parts.append(str(part.get("text", "")).strip())
-                else:
-                    text_parts.append(str(part).strip())
-            return " ".join(part for part in text_parts if part)
+            stripped_parts = (
+                str(part.get("text", "") if isinstance(part, dict) else part).strip()
+                for part in content
+            )
+            return " ".join(part for part in stripped_parts if part)
 
         return str(content).strip()
@@ -3,7 +3,13 @@
 from __future__ import annotations
 
 import asyncio
+import contextvars
+import functools
+import logging
 import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import TypeVar
 
 from crewai import LLM, Agent, Crew, Process, Task
 from dotenv import load_dotenv
@@ -12,6 +18,38 @@ from tools import AvailabilityTool
 
 load_dotenv()
 
+LOGGER = logging.getLogger(__name__)
+
+_Number = TypeVar("_Number", int, float)
+
+RESPONSE_CACHE_MAXSIZE = 256
+RESPONSE_CACHE_TTL_ENV_VAR = "AGENT_RESPONSE_CACHE_TTL"
+DEFAULT_RESPONSE_CACHE_TTL_SECONDS = 60.0
+
+LLM_POOL_SIZE_ENV_VAR = "LLM_POOL_SIZE"
+DEFAULT_LLM_POOL_SIZE = 16
+
+
+def _env_number(name: str, default: _Number, minimum: _Number) -> _Number:
+    """Read a numeric setting from the environment, falling back on invalid values."""
+    raw_value = os.getenv(name, "")
+    if not raw_value:
+        return default
+    try:
+        value = type(default)(raw_value)
+    except ValueError:
+        value = None
+    if value is None or value < minimum:
+        LOGGER.warning("Ignoring invalid %s=%r; using %s.", name, raw_value, default)
+        return default
+    return value
+
+
+_LLM_POOL = ThreadPoolExecutor(
+    max_workers=_env_number(LLM_POOL_SIZE_ENV_VAR, DEFAULT_LLM_POOL_SIZE, minimum=1),
+    thread_name_prefix="llm",
+)
+
 
 class MarkAgent:
     """Participant agent that answers questions about Mark's availability."""
@@ -37,9 +75,22 @@ class MarkAgent:
             tools=[AvailabilityTool()],
             llm=self.llm,
         )
+        self.response_cache_ttl = _env_number(
+            RESPONSE_CACHE_TTL_ENV_VAR, DEFAULT_RESPONSE_CACHE_TTL_SECONDS, minimum=0.0
+        )
+        # Each question runs a fresh crew with no memory, so answers depend only on the
+        # question. Maps normalized question -> (expiry time, answer), oldest first.
+        self._answers: dict[str, tuple[float, str]] = {}
 
     async def invoke(self, user_question: str) -> str:
         """Run a single CrewAI task and return the text result."""
+        cache_key = user_question.strip().lower()
+        cached = self._answers.get(cache_key)
+        if cached is not None:
+            if time.monotonic() < cached[0]:
+                return cached[1]
+            del self._answers[cache_key]
+
         task = Task(
             description=f"Answer this scheduling question: {user_question!r}",
             expected_output="A concise answer describing Mark's availability.",
@@ -53,8 +104,22 @@ class MarkAgent:
         )
 
         try:
-            result = await asyncio.to_thread(crew.kickoff)
+            result = await asyncio.get_running_loop().run_in_executor(
+                _LLM_POOL, functools.partial(contextvars.copy_context().run, crew.kickoff)
+            )
         except Exception as exc:  # noqa: BLE001 - return readable failure to caller
             return f"Unable to process scheduling request: {exc}"
 
-        return str(result).strip() if result else "No response available."
+        if not result:
+            return "No response available."
+
+        # Only successful answers are cached so transient failures are retried.
+        response_text = str(result).strip()
+        if self.response_cache_ttl > 0:
+            self._answers[cache_key] = (
+                time.monotonic() + self.response_cache_ttl,
+                response_text,
+            )
+            if len(self._answers) > RESPONSE_CACHE_MAXSIZE:
+                del self._answers[next(iter(self._answers))]
+        return response_text
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import re
 from datetime import date, timedelta
 
 try:
@@ -13,34 +14,42 @@ except Exception:  # noqa: BLE001 - allow importing pure helpers without CrewAI
 
 AvailabilityMap = dict[str, str]
 
+_ISO_DATE_PATTERN = re.compile(r"[0-9]{4}-[0-9]{2}-[0-9]{2}")
+_DEMO_AVAILABILITY_BY_DAY_OFFSET: tuple[tuple[int, str], ...] = (
+    (0, "busy all day"),
+    (1, "available from 11:00 to 15:00"),
+    (2, "available from 11:00 to 15:00"),
+    (3, "available all day"),
+    (4, "busy all day"),
+)
+
 
 def _build_demo_availability(base_date: date | None = None) -> AvailabilityMap:
     first_day = base_date or (date.today() + timedelta(days=1))
     return {
-        first_day.isoformat(): "busy all day",
-        (first_day + timedelta(days=1)).isoformat(): "available from 11:00 to 15:00",
-        (first_day + timedelta(days=2)).isoformat(): "available from 11:00 to 15:00",
-        (first_day + timedelta(days=3)).isoformat(): "available all day",
-        (first_day + timedelta(days=4)).isoformat(): "busy all day",
+        (first_day + timedelta(days=offset)).isoformat(): availability
+        for offset, availability in _DEMO_AVAILABILITY_BY_DAY_OFFSET
     }
 
 
 FAKE_AVAILABILITY: AvailabilityMap = _build_demo_availability()
 
 
+def _invalid_date_response(date_str: str) -> dict[str, str]:
+    return {
+        "status": "error",
+        "message": f"Invalid date '{date_str}'. Use ISO format YYYY-MM-DD.",
+    }
+
+
 def get_availability(date_str: str) -> dict[str, str]:
     """Return Mark's availability for an ISO date from the demo calendar."""
-    if not date_str or not date_str.strip():
+    normalized_date = date_str.strip() if date_str else ""
+    if not normalized_date:
         return {"status": "error", "message": "No date provided. Use YYYY-MM-DD."}
 
-    normalized_date = date_str.strip()
-    try:
-        date.fromisoformat(normalized_date)
-    except ValueError:
-        return {
-            "status": "error",
-            "message": f"Invalid date '{date_str}'. Use ISO format YYYY-MM-DD.",
-        }
+    if not _ISO_DATE_PATTERN.fullmatch(normalized_date):
+        return _invalid_date_response(date_str)
 
     availability = FAKE_AVAILABILITY.get(normalized_date)
     if availability:
@@ -49,6 +58,12 @@ def get_availability(date_str: str) -> dict[str, str]:
             "message": f"On {normalized_date}, Mark is {availability}.",
         }
 
+    # Only dates missing from the calendar need a full calendar check, e.g. 2026-02-30.
+    try:
+        date.fromisoformat(normalized_date)
+    except ValueError:
+        return _invalid_date_response(date_str)
+
     return {
         "status": "input_required",
         "message": (
@@ -0,0 +1,227 @@
+"""Unit tests for the host agent's remote messaging behaviour."""
+
+from __future__ import annotations
+
+import asyncio
+import importlib.util
+import unittest
+from unittest import mock
+
+HAS_HOST_DEPENDENCIES = bool(
+    importlib.util.find_spec("a2a") and importlib.util.find_spec("google.adk")
+)
+
+if HAS_HOST_DEPENDENCIES:
+    from a2a.types import AgentCard, SendMessageResponse
+
+    from elon_agent.elon import agent as host_agent
+
+
+def _agent_card(name: str) -> AgentCard:
+    return AgentCard.model_validate(
+        {
+            "name": name,
+            "description": f"Test agent {name}.",
+            "url": "http://localhost:9999/",
+            "version": "1.0.0",
+            "defaultInputModes": ["text"],
+            "defaultOutputModes": ["text"],
+            "capabilities": {},
+            "skills": [],
+        }
+    )
+
+
+def _success_response(request) -> SendMessageResponse:
+    return SendMessageResponse.model_validate(
+        {
+            "jsonrpc": "2.0",
+            "id": request.id,
+            "result": {
+                "kind": "message",
+                "role": "agent",
+                "messageId": f"reply-{request.id}",
+                "parts": [{"kind": "text", "text": "Available."}],
+            },
+        }
+    )
+
+
+class FakeA2AClient:
+    """Stands in for A2AClient, replaying one outcome per call."""
+
+    def __init__(self, outcomes: list[object] | None = None) -> None:
+        self.outcomes = list(outcomes or [])
+        self.calls = 0
+
+    async def send_message(self, request):
+        self.calls += 1
+        outcome = self.outcomes.pop(0) if self.outcomes else "success"
+        if isinstance(outcome, BaseException):
+            raise outcome
+        if outcome == "success":
+            return _success_response(request)
+        return outcome
+
+
+def _connection(name: str, outcomes: list[object] | None = None):
+    connection = host_agent.RemoteAgentConnection(
+        _agent_card(name), "http://localhost:9999", http_client=mock.MagicMock()
+    )
+    connection.client = FakeA2AClient(outcomes)
+    return connection
+
+
+def _host_with(*connections) -> host_agent.ElonAgent:
+    host = host_agent.ElonAgent()
+    for connection in connections:
+        host.remote_connections[connection.agent_card.name] = connection
+    host._casefolded_connections = {
+        name.casefold(): connection for name, connection in host.remote_connections.items()
+    }
+    host._sorted_remote_names = tuple(sorted(host.remote_connections))
+    return host
+
+
+@unittest.skipUnless(HAS_HOST_DEPENDENCIES, "a2a-sdk and google-adk are not installed")
+class CircuitBreakerTests(unittest.TestCase):
+    def _send(self, connection):
+        request = host_agent.ElonAgent._build_send_request("Free on 2026-03-01?")
+        return asyncio.run(connection.send_message(request))
+
+    def test_circuit_opens_after_consecutive_failures(self) -> None:
+        connection = _connection("Jeff", [ConnectionError("down")] * 3)
+        for _ in range(host_agent.CIRCUIT_BREAKER_FAILURE_THRESHOLD):
+            with self.assertRaises(ConnectionError):
+                self._send(connection)
+
+        with self.assertRaises(host_agent.RemoteAgentUnavailableError):
+            self._send(connection)
+        self.assertEqual(connection.client.calls, 3)
+
+    def test_success_after_cooldown_closes_circuit(self) -> None:
+        connection = _connection("Jeff", [ConnectionError("down")] * 3)
+        for _ in range(host_agent.CIRCUIT_BREAKER_FAILURE_THRESHOLD):
+            with self.assertRaises(ConnectionError):
+                self._send(connection)
+
+        connection.opened_until = 0.0  # cooldown elapsed: half-open
+        self._send(connection)
+
+        self.assertEqual(connection.consecutive_failures, 0)
+        self.assertIsNone(connection.opened_until)
+
+    def test_failure_after_cooldown_reopens_circuit(self) -> None:
+        connection = _connection("Jeff", [ConnectionError("down")] * 4)
+        for _ in range(host_agent.CIRCUIT_BREAKER_FAILURE_THRESHOLD):
+            with self.assertRaises(ConnectionError):
+                self._send(connection)
+
+        connection.opened_until = 0.0
+        with self.assertRaises(ConnectionError):
+            self._send(connection)
+        with self.assertRaises(host_agent.RemoteAgentUnavailableError):
+            self._send(connection)
+
+    def test_timeout_counts_as_failure(self) -> None:
+        connection = _connection("Jeff")
+
+        async def hang(request):
+            await asyncio.sleep(1)
+
+        connection.client.send_message = hang
+        with mock.patch.object(host_agent, "REMOTE_AGENT_TIMEOUT_SECONDS", 0.01):
+            with self.assertRaises(asyncio.TimeoutError):
+                self._send(connection)
+        self.assertEqual(connection.consecutive_failures, 1)
+
+
+@unittest.skipUnless(HAS_HOST_DEPENDENCIES, "a2a-sdk and google-adk are not installed")
+class SendMessageToolTests(unittest.TestCase):
+    def test_open_circuit_is_reported_as_error(self) -> None:
+        connection = _connection("Jeff")
+        connection.opened_until = float("inf")
+        host = _host_with(connection)
+
+        result = asyncio.run(host.send_message("Jeff", "Free?", mock.MagicMock()))
+
+        self.assertEqual(result["status"], "error")
+        self.assertIn("temporarily unavailable", result["message"])
+        self.assertEqual(connection.client.calls, 0)
+
+    def test_transport_failure_is_reported_as_error(self) -> None:
+        host = _host_with(_connection("Jeff", [ConnectionError("refused")]))
+
+        result = asyncio.run(host.send_message("Jeff", "Free?", mock.MagicMock()))
+
+        self.assertEqual(result["status"], "error")
+        self.assertIn("refused", result["message"])
+
+    def test_json_rpc_error_response_is_reported_as_error(self) -> None:
+        error_response = SendMessageResponse.model_validate(
+            {
+                "jsonrpc": "2.0",
+                "id": "1",
+                "error": {"code": -32603, "message": "Internal error"},
+            }
+        )
+        host = _host_with(_connection("Jeff", [error_response]))
+
+        result = asyncio.run(host.send_message("Jeff", "Free?", mock.MagicMock()))
+
+        self.assertEqual(result["status"], "error")
+        self.assertEqual(result["message"], "Internal error")
+
+    def test_success_response_is_reported_as_success(self) -> None:
+        host = _host_with(_connection("Jeff"))
+
+        result = asyncio.run(host.send_message("jeff", "Free?", mock.MagicMock()))
+
+        self.assertEqual(result["status"], "success")
+        self.assertEqual(result["agent_name"], "Jeff")
+
+
+@unittest.skipUnless(HAS_HOST_DEPENDENCIES, "a2a-sdk and google-adk are not installed")
+class SendMessageManyToolTests(unittest.TestCase):
+    def test_case_variants_send_one_request_per_agent(self) -> None:
+        jeff = _connection("Jeff Agent")
+        mark = _connection("Mark Agent")
+        host = _host_with(jeff, mark)
+
+        results = asyncio.run(
+            host.send_message_many(
+                ["Jeff Agent", "jeff agent", "MARK AGENT"], "Free?", mock.MagicMock()
+            )
+        )
+
+        self.assertEqual(jeff.client.calls, 1)
+        self.assertEqual(mark.client.calls, 1)
+        self.assertEqual(set(results), {"Jeff Agent", "Mark Agent"})
+
+    def test_unknown_agent_is_reported_without_blocking_others(self) -> None:
+        host = _host_with(_connection("Jeff"))
+
+        results = asyncio.run(
+            host.send_message_many(["Jeff", "Bill"], "Free?", mock.MagicMock())
+        )
+
+        self.assertEqual(results["Jeff"]["status"], "success")
+        self.assertEqual(results["Bill"]["status"], "error")
+        self.assertIn("Unknown agent 'Bill'", results["Bill"]["message"])
+
+    def test_partial_failure_keeps_successful_answers(self) -> None:
+        host = _host_with(
+            _connection("Jeff"), _connection("Mark", [ConnectionError("refused")])
+        )
+
+        results = asyncio.run(
+            host.send_message_many(["Jeff", "Mark"], "Free?", mock.MagicMock())
+        )
+
+        self.assertEqual(results["Jeff"]["status"], "success")
+        self.assertEqual(results["Mark"]["status"], "error")
+        self.assertIn("refused", results["Mark"]["message"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,149 @@
+"""Unit tests for participant agent response caching and configuration."""
+
+from __future__ import annotations
+
+import asyncio
+import importlib
+import importlib.util
+import os
+import sys
+import unittest
+from pathlib import Path
+from types import ModuleType
+from unittest import mock
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+
+
+def _load_participant_agent(project: str) -> ModuleType:
+    """Import ``<project>/agent.py`` the way its server entry point does."""
+    shadowed = {name: sys.modules.pop(name, None) for name in ("agent", "tools")}
+    sys.path.insert(0, str(REPO_ROOT / project))
+    try:
+        with mock.patch.dict(os.environ, {"GOOGLE_API_KEY": "test-key"}):
+            return importlib.import_module("agent")
+    finally:
+        sys.path.remove(str(REPO_ROOT / project))
+        for name, module in shadowed.items():
+            sys.modules.pop(name, None)
+            if module is not None:
+                sys.modules[name] = module
+
+
+@unittest.skipUnless(
+    importlib.util.find_spec("langchain") and importlib.util.find_spec("langgraph"),
+    "LangChain is not installed",
+)
+class JeffAgentCacheTests(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls) -> None:
+        cls.module = _load_participant_agent("jeff_agent")
+
+    def _build_agent(self, answers: list[str], **env: str):
+        from langchain.agents import create_agent
+        from langchain_core.language_models.fake_chat_models import GenericFakeChatModel
+        from langchain_core.messages import AIMessage
+        from langgraph.checkpoint.memory import MemorySaver
+
+        class FakeChatModel(GenericFakeChatModel):
+            def bind_tools(self, tools, **kwargs):
+                return self
+
+        model = FakeChatModel(messages=iter(AIMessage(answer) for answer in answers))
+        with mock.patch.dict(os.environ, {"GOOGLE_API_KEY": "test-key", **env}):
+            agent = self.module.JeffAgent()
+        agent.graph = create_agent(
+            model,
+            tools=[],
+            system_prompt=agent.system_prompt,
+            checkpointer=MemorySaver(),
+        )
+        return agent
+
+    def _history(self, agent, context_id: str) -> list[str]:
+        config = {"configurable": {"thread_id": context_id}}
+        return [message.content for message in agent.graph.get_state(config).values["messages"]]
+
+    def test_first_turn_answer_is_reused_and_recorded_in_new_context(self) -> None:
+        agent = self._build_agent(["Jeff is free.", "unexpected"])
+
+        first = asyncio.run(agent.get_response("Free on 2026-03-01?", "ctx-1"))
+        second = asyncio.run(agent.get_response("free on 2026-03-01?  ", "ctx-2"))
+
+        self.assertEqual(first, "Jeff is free.")
+        self.assertEqual(second, "Jeff is free.")
+        self.assertEqual(
+            self._history(agent, "ctx-2"), ["free on 2026-03-01?  ", "Jeff is free."]
+        )
+
+    def test_follow_up_turns_are_not_answered_from_cache(self) -> None:
+        agent = self._build_agent(["Jeff is free.", "Yes, booked.", "Yes, booked again."])
+
+        asyncio.run(agent.get_response("yes", "ctx-1"))
+        follow_up = asyncio.run(agent.get_response("yes", "ctx-1"))
+
+        self.assertEqual(follow_up, "Yes, booked.")
+
+    def test_zero_ttl_disables_cache(self) -> None:
+        agent = self._build_agent(
+            ["Jeff is free.", "Jeff is busy."], AGENT_RESPONSE_CACHE_TTL="0"
+        )
+
+        asyncio.run(agent.get_response("Free on 2026-03-01?", "ctx-1"))
+        second = asyncio.run(agent.get_response("Free on 2026-03-01?", "ctx-2"))
+
+        self.assertEqual(second, "Jeff is busy.")
+
+    def test_malformed_ttl_falls_back_to_default(self) -> None:
+        with self.assertLogs(self.module.LOGGER, level="WARNING"):
+            agent = self._build_agent([], AGENT_RESPONSE_CACHE_TTL="soon")
+        self.assertEqual(
+            agent.response_cache_ttl, self.module.DEFAULT_RESPONSE_CACHE_TTL_SECONDS
+        )
+
+
+@unittest.skipUnless(importlib.util.find_spec("crewai"), "CrewAI is not installed")
+class MarkAgentCacheTests(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls) -> None:
+        cls.module = _load_participant_agent("mark_agent")
+
+    def _build_agent(self, **env: str):
+        with mock.patch.dict(os.environ, {"GOOGLE_API_KEY": "test-key", **env}):
+            return self.module.MarkAgent()
+
+    def _invoke_with_results(self, agent, questions: list[str], results: list[object]):
+        crew = mock.MagicMock()
+        crew.return_value.kickoff.side_effect = results
+        with mock.patch.object(self.module, "Crew", crew), mock.patch.object(
+            self.module, "Task"
+        ):
+            return [asyncio.run(agent.invoke(question)) for question in questions]
+
+    def test_repeated_question_is_answered_from_cache(self) -> None:
+        agent = self._build_agent()
+        answers = self._invoke_with_results(
+            agent, ["Free on 2026-03-01?", " free on 2026-03-01?"], ["Mark is free."]
+        )
+        self.assertEqual(answers, ["Mark is free.", "Mark is free."])
+
+    def test_failures_are_not_cached(self) -> None:
+        agent = self._build_agent()
+        answers = self._invoke_with_results(
+            agent,
+            ["Free on 2026-03-01?", "Free on 2026-03-01?"],
+            [RuntimeError("quota"), "Mark is free."],
+        )
+        self.assertTrue(answers[0].startswith("Unable to process scheduling request"))
+        self.assertEqual(answers[1], "Mark is free.")
+
+    def test_malformed_ttl_falls_back_to_default(self) -> None:
+        with self.assertLogs(self.module.LOGGER, level="WARNING"):
+            agent = self._build_agent(AGENT_RESPONSE_CACHE_TTL="-5")
+        self.assertEqual(
+            agent.response_cache_ttl, self.module.DEFAULT_RESPONSE_CACHE_TTL_SECONDS
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -60,6 +60,18 @@ class CourtToolTests(unittest.TestCase):
         self.assertEqual(booking_result["status"], "success")
         self.assertEqual(court_tools.COURT_SCHEDULE[demo_date][selected_slot], "Team A")
 
+    def test_booking_rejects_malformed_time(self) -> None:
+        demo_date = next(iter(court_tools.COURT_SCHEDULE.keys()))
+        for end_time in ("9am", "24:00", "09:60", "0900"):
+            booking_result = court_tools.book_badminton_court(
+                requested_date=demo_date,
+                start_time="08:00",
+                end_time=end_time,
+                reservation_name="Team A",
+            )
+            self.assertEqual(booking_result["status"], "error")
+            self.assertIn("HH:MM", booking_result["message"])
+
 
 if __name__ == "__main__":
     unittest.main()